@@ -1,4 +1,4 @@
-from order.cli import app
+from order.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -0,0 +1,27 @@
+from typing import Dict, Optional, Tuple
+import os
+
+_CACHE: Dict[str, Tuple[int, int, int, str]] = {}
+
+def _fingerprint(st: os.stat_result) -> Tuple[int, int, int]:
+    """Identify a file version by inode, mtime and size; atomic replaces always change the inode"""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def get(path: str, st: os.stat_result) -> Optional[str]:
+    """Return cached content for path if its inode, mtime and size still match"""
+    entry = _CACHE.get(os.path.abspath(path))
+    if entry is not None and entry[:3] == _fingerprint(st):
+        return entry[3]
+    return None
+
+def put(path: str, st: os.stat_result, content: str) -> None:
+    """Store content for path fingerprinted by its inode, mtime and size"""
+    _CACHE[os.path.abspath(path)] = (*_fingerprint(st), content)
+
+def invalidate(path: str) -> None:
+    """Drop any cached content for path"""
+    _CACHE.pop(os.path.abspath(path), None)
+
+def clear() -> None:
+    """Drop all cached content"""
+    _CACHE.clear()
@@ -1,4 +1,6 @@
 import os
+import sys
+import functools
 import typer
 from datetime import datetime
 from order.markdown_handler import MarkdownHandler, MarkdownResult
@@ -7,20 +9,108 @@ DEV_NOTES_FILE: str = "dev-notes.md"
 TODO_SECTION: str = "Todo"
 NOTES_SECTION: str = "Notes"
 IDEAS_SECTION: str = "Ideas"
+DEFAULT_MAX_WALK: int = 30
+
+try:
+    ORDER_NOTES_MAX_WALK: int = int(os.environ.get("ORDER_NOTES_MAX_WALK", DEFAULT_MAX_WALK))
+except ValueError:
+    ORDER_NOTES_MAX_WALK = DEFAULT_MAX_WALK
+
+JEDI_TARGETS: tuple = (
+    "Master Yoda",
+    "Obi-Wan Kenobi",
+    "Mace Windu",
+    "Anakin Skywalker",
+    "Ahsoka Tano",
+    "Ki-Adi-Mundi",
+    "Plo Koon",
+    "Kit Fisto",
+    "Aayla Secura",
+    "Luminara Unduli",
+)
+ORDER_66_OUTPUT: str = (
+    "EXECUTING ORDER 66\n"
+    "The time has come. Execute Order 66.\n"
+    "\nJedi Target List:\n"
+    + "".join(f"  {jedi}\n" for jedi in JEDI_TARGETS)
+    + "\nGood soldiers follow orders.\n"
+)
+
+HELP_TEXT: str = """Order CLI - Developer Notes & Task Management
+
+A terminal-based productivity tool for developers to manage daily 
+tasks, notes, and ideas in a git-friendly markdown format.
+
+Quick Start Examples:
+# Add task to today's todo list
+- order add "Fix login bug"
+
+# Add contextual note
+- order note "Left off debugging OAuth"
+
+# Capture feature idea
+- order idea "Consider caching"
+
+# Mark task as complete (partial match)
+- order done "login"
+
+# Show today's task list
+- order today
+
+# Show all content
+- order list
+
+Task Management:
+# Move task to today with history
+- order carry "old task"
+
+# Remove task entirely
+- order delete "redundant task"
+
+# Find content across dates
+- order search "keyword"
+
+Git Integration:
+# Auto-commit dev notes with code
+- order install-hooks
+
+# Add project-level information
+- order context "Project background"
+
+Team Collaboration:
+# Override branch detection
+- order add "task" --branch feature
+
+File Location: dev-notes.md (created automatically)
+Structure: Daily sections with user subsections for team collaboration
+""".strip()
+
+_notes_file_override: str = None
 
 def find_dev_notes_file() -> str:
     """Find dev-notes.md in current directory or walk up to find existing one"""
-    custom_file = os.environ.get("ORDER_NOTES_FILE")
+    if _notes_file_override:
+        return _notes_file_override
+    return _find_dev_notes_file(os.getcwd(), os.environ.get("ORDER_NOTES_FILE"))
+
+@functools.lru_cache(maxsize=32)
+def _find_dev_notes_file(current_dir: str, custom_file: str) -> str:
+    """Resolve the dev notes path for a working directory, memoized per (cwd, ORDER_NOTES_FILE)"""
     if custom_file:
         return custom_file
     
-    current_dir = os.getcwd()
-    
-    while current_dir != os.path.dirname(current_dir):  # Stop at root
-        potential_file = os.path.join(current_dir, DEV_NOTES_FILE)
-        if os.path.exists(potential_file):
-            return potential_file
-        current_dir = os.path.dirname(current_dir)
+    sep = os.sep
+    parts = current_dir.rstrip(sep).split(sep)
+
+    stop = max(1, len(parts) - ORDER_NOTES_MAX_WALK)
+
+    for i in range(len(parts), stop, -1):  # Stop before root or after ORDER_NOTES_MAX_WALK levels
+        potential_file = sep.join(parts[:i]) + sep + DEV_NOTES_FILE
+        try:
+            os.stat(potential_file)
+        except OSError:
+            continue
+        return potential_file
     
     return DEV_NOTES_FILE
 
@@ -30,13 +120,16 @@ def _validate_content(content: str, content_type: str) -> None:
         typer.echo(f"Error: {content_type} content cannot be empty")
         raise typer.Exit(1)
 
+def add_content(section_type: str, content: str, branch: str = None) -> MarkdownResult:
+    """Add content to today's section of the dev notes file without any CLI output"""
+    handler = get_handler()
+    return handler.add_content_to_daily_section(get_today(), section_type, content, branch)
+
 def _add_content_with_feedback(section_type: str, content: str, content_type: str, branch: str = None) -> None:
     """Add content to daily section with consistent error handling"""
     _validate_content(content, content_type)
     
-    handler = get_handler()
-    today = get_today()
-    result = handler.add_content_to_daily_section(today, section_type, content, branch)
+    result = add_content(section_type, content, branch)
     
     handle_result(result, f"{content_type} added: {content}", "Failed to add content")
 
@@ -45,8 +138,7 @@ def get_handler() -> MarkdownHandler:
     file_path = find_dev_notes_file()
     
     handler = MarkdownHandler(file_path)
-    result = handler.read_file()
-    if not result.success:
+    if not os.path.exists(file_path):
         create_result = handler.create_file()
         if not create_result.success:
             typer.echo(f"Error: Failed to create file - {create_result.error}")
@@ -57,6 +149,12 @@ def get_today() -> str:
     """Get today's date in YYYY-MM-DD format"""
     return datetime.now().strftime("%Y-%m-%d")
 
+def _write_output(text: str) -> None:
+    """Write bulk command output straight to stdout, bypassing click's echo handling"""
+    sys.stdout.write(text)
+    sys.stdout.write('\n')
+    sys.stdout.flush()
+
 def handle_result(result: MarkdownResult, success_msg: str, error_action: str) -> None:
     """Handle MarkdownResult with consistent success/error patterns"""
     if result.success:
@@ -68,6 +166,12 @@ def handle_result(result: MarkdownResult, success_msg: str, error_action: str) -
 
 app = typer.Typer()
 
+@app.callback()
+def _global_options(file: str = typer.Option(None, "--file", help="Path to the dev notes file, skipping discovery")) -> None:
+    """Order CLI - Developer Notes & Task Management"""
+    global _notes_file_override
+    _notes_file_override = file
+
 @app.command()
 def add(title: str, branch: str = typer.Option(None, "--branch", help="Override git branch detection")) -> None:
     """Add a new task"""
@@ -91,7 +195,7 @@ def list() -> None:
     result = handler.read_file()
     
     if result.success:
-        typer.echo(result.content)
+        _write_output(result.content)
     else:
         typer.echo(f"Error: Failed to read file - {result.error}")
         raise typer.Exit(1)
@@ -120,7 +224,7 @@ def today() -> None:
     result = handler.parse_daily_section(today_date)
     
     if result.success:
-        typer.echo(result.content)
+        _write_output(result.content)
     else:
         typer.echo(f"Error: Failed to read today's section - {result.error}")
         raise typer.Exit(1)
@@ -132,7 +236,7 @@ def search(query: str) -> None:
     result = handler.search_content(query)
     
     if result.success:
-        typer.echo(result.content)
+        _write_output(result.content)
     else:
         typer.echo(f"Error: Search failed - {result.error}")
         raise typer.Exit(1)
@@ -148,25 +252,7 @@ def carry(partial_text: str) -> None:
 @app.command("66")
 def order_66() -> None:
     """Execute Order 66"""
-    jedi_list = [
-        "Master Yoda",
-        "Obi-Wan Kenobi", 
-        "Mace Windu",
-        "Anakin Skywalker",
-        "Ahsoka Tano",
-        "Ki-Adi-Mundi",
-        "Plo Koon",
-        "Kit Fisto",
-        "Aayla Secura",
-        "Luminara Unduli"
-    ]
-    
-    typer.echo("EXECUTING ORDER 66")
-    typer.echo("The time has come. Execute Order 66.")
-    typer.echo("\nJedi Target List:")
-    for jedi in jedi_list:
-        typer.echo(f"  {jedi}")
-    typer.echo("\nGood soldiers follow orders.")
+    sys.stdout.write(ORDER_66_OUTPUT)
 
 @app.command()
 def install_hooks() -> None:
@@ -184,7 +270,7 @@ def context(content: str = typer.Argument(None, help="Context to add. Use 'show'
         result = handler.get_project_context()
 
         if result.success:
-            typer.echo(result.content)
+            _write_output(result.content)
         else:
             typer.echo(f"Error: Failed to read context - {result.error}")
             raise typer.Exit(1)
@@ -198,55 +284,7 @@ def context(content: str = typer.Argument(None, help="Context to add. Use 'show'
 @app.command()
 def help() -> None:
     """Show comprehensive usage guide with examples and tips"""
-    help_text = """Order CLI - Developer Notes & Task Management
-
-A terminal-based productivity tool for developers to manage daily 
-tasks, notes, and ideas in a git-friendly markdown format.
-
-Quick Start Examples:
-# Add task to today's todo list
-- order add "Fix login bug"
-
-# Add contextual note
-- order note "Left off debugging OAuth"
-
-# Capture feature idea
-- order idea "Consider caching"
-
-# Mark task as complete (partial match)
-- order done "login"
-
-# Show today's task list
-- order today
-
-# Show all content
-- order list
-
-Task Management:
-# Move task to today with history
-- order carry "old task"
-
-# Remove task entirely
-- order delete "redundant task"
-
-# Find content across dates
-- order search "keyword"
-
-Git Integration:
-# Auto-commit dev notes with code
-- order install-hooks
-
-# Add project-level information
-- order context "Project background"
-
-Team Collaboration:
-# Override branch detection
-- order add "task" --branch feature
-
-File Location: dev-notes.md (created automatically)
-Structure: Daily sections with user subsections for team collaboration
-"""
-    typer.echo(help_text.strip())
+    _write_output(HELP_TEXT)
 
 @app.command()
 def backlog(task: str) -> None:
@@ -267,3 +305,15 @@ def promote(partial_text: str) -> None:
     result = handler.promote_backlog_task(partial_text)
     
     handle_result(result, f"Task promoted: {result.content}", "Failed to promote task")
+
+FAST_COMMANDS: dict = {
+    "66": order_66,
+    "help": help,
+}
+
+def main() -> None:
+    """Console entry point: run argument-free no-I/O commands directly, everything else via typer"""
+    if len(sys.argv) == 2 and sys.argv[1] in FAST_COMMANDS:
+        FAST_COMMANDS[sys.argv[1]]()
+        return
+    app()
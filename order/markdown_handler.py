@@ -1,16 +1,37 @@
 from typing import Optional
 import re
+import functools
 import os
-import subprocess
 import getpass
 import stat
 from datetime import datetime
+from order import _cache
 
 TASK_INCOMPLETE = "- [ ]"
 TASK_COMPLETE = "- [x]"
-DATE_FORMAT_PATTERN = r'^\d{4}-\d{2}-\d{2}$'
-DATE_SECTION_PATTERN = r'## \d{4}-\d{2}-\d{2}'
-VALID_SECTION_TYPES = ["Todo", "Notes", "Ideas"]
+VALID_SECTION_TYPES_DISPLAY = ("Todo", "Notes", "Ideas")
+VALID_SECTION_TYPES = frozenset(VALID_SECTION_TYPES_DISPLAY)
+_LEGACY_DATE_HEADER_RE = re.compile(r'^## (.+?) \(@([^)\n]+)\)[ \t]*$', re.MULTILINE)
+_H3_RE = re.compile(r'^### (.*)$', re.MULTILINE)
+_TODO_LINE_RE = re.compile(r'^[ \t]*' + re.escape(TASK_INCOMPLETE) + r'.*$', re.MULTILINE)
+WRITE_BUFFER_SIZE = 65536
+NEW_FILE_TEMPLATE = """# Dev Notes
+
+## Project Context
+
+*Add project-level context, goals, and background information here.*
+
+"""
+
+@functools.lru_cache(maxsize=1)
+def _current_username() -> str:
+    """Look up the current user once per process"""
+    return getpass.getuser()
+
+def _is_date_header(line: str) -> bool:
+    """Check for a '## YYYY-MM-DD' header line with plain slice tests instead of a regex"""
+    return (len(line) >= 13 and line.startswith("## ") and line[7] == '-' and line[10] == '-'
+            and line[3:7].isdecimal() and line[8:10].isdecimal() and line[11:13].isdecimal())
 
 class MarkdownResult:
     def __init__(self, success: bool = True, content: Optional[str] = None, error: Optional[str] = None) -> None:
@@ -23,53 +44,78 @@ class MarkdownHandler:
         self.file_path = file_path
         self._cached_content: Optional[str] = None
         self._cache_valid = False
+        self._cached_lines: Optional[tuple] = None
         self._cached_branch: Optional[str] = None
-        self._cached_username: Optional[str] = None
 
-    def _invalidate_cache(self) -> None:
-        """Invalidate cache after file modifications"""
-        self._cache_valid = False
-        self._cached_content = None
+    def _split_lines(self, content: str) -> list:
+        """Split content into lines, reusing the split of the cached file content"""
+        if content is not self._cached_content:
+            return content.split('\n')
+        if self._cached_lines is None:
+            self._cached_lines = tuple(content.split('\n'))
+        return list(self._cached_lines)
 
     def _validate_date_format(self, date: str) -> MarkdownResult:
-        """Validate date format and return error if invalid"""
-        if not re.match(DATE_FORMAT_PATTERN, date):
+        """Validate date format and calendar date, returning an error if invalid"""
+        year, month, day = date[:4], date[5:7], date[8:]
+        if (len(date) != 10 or date[4] != '-' or date[7] != '-'
+                or not (year.isdecimal() and month.isdecimal() and day.isdecimal())):
             return MarkdownResult(success=False, error="Invalid date format. Use YYYY-MM-DD")
-        
+
         try:
-            year, month, day = map(int, date.split('-'))
-            if not (1 <= month <= 12 and 1 <= day <= 31):
-                return MarkdownResult(success=False, error="Invalid date format. Use YYYY-MM-DD")
+            datetime(int(year), int(month), int(day))
         except ValueError:
             return MarkdownResult(success=False, error="Invalid date format. Use YYYY-MM-DD")
         
         return MarkdownResult(success=True)
 
-    def _write_file_safely(self, content: str) -> MarkdownResult:
-        """Write content to file with error handling"""
+    def _store(self, content: str) -> None:
+        """Write content to disk atomically via a temp file and os.replace, raising OSError on failure"""
+        target = os.path.realpath(self.file_path)  # Write through symlinks rather than replacing them
+        tmp_path = f"{target}.{os.getpid()}.tmp"
         try:
-            with open(self.file_path, 'w') as f:
-                f.write(content)
-            self._invalidate_cache()  
-            return MarkdownResult(success=True)
-        except PermissionError:
-            return MarkdownResult(success=False, error="Permission denied")
-        except OSError as e:
-            return MarkdownResult(success=False, error=f"File system error: {str(e)}")
-        except Exception as e:
-            return MarkdownResult(success=False, error=f"Unexpected error: {str(e)}")
+            mode = os.stat(target).st_mode & 0o777
+        except FileNotFoundError:
+            mode = None
+        else:
+            if not os.access(target, os.W_OK):
+                raise PermissionError(target)
 
-    def create_file(self) -> MarkdownResult:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
         try:
-            with open(self.file_path, 'w') as f:
-                f.write("""# Dev Notes
-
-## Project Context
-
-*Add project-level context, goals, and background information here.*
+            with os.fdopen(fd, 'w', buffering=WRITE_BUFFER_SIZE, encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                st = os.fstat(f.fileno())
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        _cache.put(self.file_path, st, content)
+
+    def _load(self) -> str:
+        """Read content from disk, reusing the shared cache while inode, mtime and size are unchanged"""
+        st = os.stat(self.file_path)
+        content = _cache.get(self.file_path, st)
+        if content is None:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            _cache.put(self.file_path, st, content)
+        return content
 
-""")
-            self._invalidate_cache()
+    def _write_file_safely(self, content: str) -> MarkdownResult:
+        """Write content through _store with error handling, keeping it as the cached content"""
+        try:
+            self._store(content)
+            self._cached_content = content
+            self._cached_lines = None
+            self._cache_valid = True
             return MarkdownResult(success=True)
         except PermissionError:
             return MarkdownResult(success=False, error="Permission denied")
@@ -78,16 +124,26 @@ class MarkdownHandler:
         except Exception as e:
             return MarkdownResult(success=False, error=f"Unexpected error: {str(e)}")
 
+    def _write_lines_safely(self, lines: list) -> MarkdownResult:
+        """Join and write lines, keeping them as the cached split of the new content"""
+        result = self._write_file_safely('\n'.join(lines))
+        if result.success:
+            self._cached_lines = tuple(lines)
+        return result
+
+    def create_file(self) -> MarkdownResult:
+        return self._write_file_safely(NEW_FILE_TEMPLATE)
+
     def read_file(self) -> MarkdownResult:
-        """Read file with caching"""
+        """Read file through _load, reusing this handler's content until it writes"""
         if self._cache_valid and self._cached_content is not None:
             return MarkdownResult(success=True, content=self._cached_content)
         
         try:
-            with open(self.file_path, 'r') as f:
-                content = f.read()
+            content = self._load()
             
             self._cached_content = content
+            self._cached_lines = None
             self._cache_valid = True
             
             return MarkdownResult(success=True, content=content)
@@ -105,20 +161,31 @@ class MarkdownHandler:
         if not result.success:
             return result
             
-        lines = result.content.split('\n')
-        section_lines = []
-        in_target_section = False
-
-        for line in lines:
-            if line.startswith(f"## {date}"):
-                in_target_section = True
-                section_lines.append(line)
-            elif line.startswith("## ") and in_target_section:
-                break
-            elif in_target_section:
-                section_lines.append(line)
-
-        return MarkdownResult(success=True, content='\n'.join(section_lines))
+        content = result.content
+        date_header = f"## {date}"
+        start = self._find_line_start(content, date_header)
+        if start == -1:
+            return MarkdownResult(success=True, content="")
+
+        end = self._find_section_end(content, start, date_header)
+        if end == -1:
+            end = len(content)
+
+        return MarkdownResult(success=True, content=content[start:end])
+
+    def _find_section_end(self, content: str, start: int, date_header: str) -> int:
+        """Return the offset of the newline before the header that ends the date section at start, or -1"""
+        end = content.find("\n## ", start)
+        while end != -1 and content.startswith(date_header, end + 1):
+            end = content.find("\n## ", end + 1)
+        return end
+
+    def _find_line_start(self, content: str, prefix: str) -> int:
+        """Return the offset of the first line starting with prefix, or -1"""
+        if content.startswith(prefix):
+            return 0
+        index = content.find('\n' + prefix)
+        return index + 1 if index != -1 else -1
 
     def add_content_to_daily_section(self, date: str, section_type: str, content: str, branch_override: str = None) -> MarkdownResult:
         """Add content to a daily section, creating the date section if needed"""
@@ -127,7 +194,7 @@ class MarkdownHandler:
             return validation_result
 
         if not section_type or section_type not in VALID_SECTION_TYPES:
-            return MarkdownResult(success=False, error=f"Invalid section type. Use: {VALID_SECTION_TYPES}")
+            return MarkdownResult(success=False, error=f"Invalid section type. Use: {', '.join(VALID_SECTION_TYPES_DISPLAY)}")
         
         if not content.strip():
             return MarkdownResult(success=False, error="Content cannot be empty")
@@ -136,10 +203,15 @@ class MarkdownHandler:
         if not result.success:
             return result
 
-        if f"## {date}" not in result.content:
-            return self._create_new_date_section(date, section_type, content, branch_override)
+        file_content = result.content
+        date_index = self._find_line_start(file_content, f"## {date}")
+
+        if date_index != -1:
+            updated = self._add_to_existing_date_section(file_content, date_index, date, section_type, content)
         else:
-            return self._add_to_existing_date_section(date, section_type, content, branch_override)
+            updated = self._create_new_date_section(file_content, date, section_type, content, branch_override)
+
+        return self._write_file_safely(updated)
 
     def mark_task_complete(self, partial_text: str) -> MarkdownResult:
         """Find and mark a task as complete based on partial text match"""
@@ -150,46 +222,39 @@ class MarkdownHandler:
         if not result.success:
             return result
 
-        lines = result.content.split('\n')
+        content = result.content
+        match = self._find_todo_line(content, partial_text)
 
-        for i, line in enumerate(lines):
-            if TASK_INCOMPLETE in line and partial_text.lower() in line.lower():
-                lines[i] = line.replace(TASK_INCOMPLETE, TASK_COMPLETE)
-                break
+        if match is not None:
+            marker = content.index(TASK_INCOMPLETE, match.start())
+            content = content[:marker] + TASK_COMPLETE + content[marker + len(TASK_INCOMPLETE):]
 
-        return self._write_file_safely('\n'.join(lines))
+        return self._write_file_safely(content)
 
-    def get_username(self) -> str:
-        """Get current username for attribute section with caching"""
-        if self._cached_username is not None:
-            return self._cached_username
-        
-        self._cached_username = getpass.getuser()
-        return self._cached_username
+    def _find_todo_line(self, content: str, partial_text: str) -> Optional[re.Match]:
+        """Find the first incomplete task line containing partial_text, case-insensitively"""
+        query = partial_text.lower()
+        for match in _TODO_LINE_RE.finditer(content):
+            if query in match.group().lower():
+                return match
+        return None
 
-    def _create_new_date_section(self, date: str, section_type: str, content: str, branch_override: str = None) -> MarkdownResult:
-        """Create a new date section with user-specific subsection"""
-        validation_result = self._validate_date_format(date)
-        if not validation_result.success:
-            return validation_result
-        
-        result = self.read_file()
-        if not result.success:
-            return result
-            
-        lines = result.content.split('\n')
-        insert_index = 1
+    def get_username(self) -> str:
+        """Get current username for attribute section, cached for the process"""
+        return _current_username()
 
-        for i, line in enumerate(lines):
-            if line.startswith("# "):
-                insert_index = i + 1
-                break
+    def _create_new_date_section(self, file_content: str, date: str, section_type: str, content: str, branch_override: str = None) -> str:
+        """Return file_content with a new date section and user-specific subsection after the title"""
+        header_start = self._find_line_start(file_content, "# ")
+        insert_at = file_content.find('\n', max(header_start, 0))
+        if insert_at == -1:
+            insert_at = len(file_content)
 
         username = self.get_username()
         branch = branch_override if branch_override is not None else self.get_current_branch()
         user_section = f"{username}-{branch}" if branch else username
         
-        new_section = [
+        new_section = '\n'.join([
             f"", 
             f"## {date}", 
             f"", 
@@ -197,52 +262,17 @@ class MarkdownHandler:
             f"#### {section_type}", 
             content, 
             ""
-        ]
+        ])
 
-        for i, new_line in enumerate(new_section):
-            lines.insert(insert_index + i, new_line)
+        return file_content[:insert_at] + '\n' + new_section + file_content[insert_at:]
 
-        return self._write_file_safely('\n'.join(lines))
+    def _add_to_existing_date_section(self, file_content: str, date_index: int, date: str, section_type: str, content: str) -> str:
+        """Return file_content with content added to the date section at date_index, before the next header"""
+        end = self._find_section_end(file_content, date_index, f"## {date}")
 
-    def _add_to_existing_date_section(self, date: str, section_type: str, content: str, branch_override: str = None) -> MarkdownResult:
-        """Add content to existing date section"""
-        validation_result = self._validate_date_format(date)
-        if not validation_result.success:
-            return validation_result
-        
-        result = self.read_file()
-        if not result.success:
-            return result
-            
-        lines = result.content.split('\n')
-        updated_lines = self._insert_content_into_existing_date(lines, date, section_type, content)
-        
-        return self._write_file_safely('\n'.join(updated_lines))
-
-    def _insert_content_into_existing_date(self, lines: list, date: str, section_type: str, content: str) -> list:
-        """Insert content into existing date section, handling section placement correctly"""
-        result_lines = []
-        in_target_date = False
-        section_added = False
-
-        for line in lines:
-            result_lines.append(line)
-
-            if line.startswith(f"## {date}"):
-                in_target_date = True
-            elif line.startswith("## ") and in_target_date and not section_added:
-                result_lines.insert(-1, f"### {section_type}")
-                result_lines.insert(-1, content)
-                result_lines.insert(-1, "")
-                section_added = True
-                in_target_date = False
-
-        if in_target_date and not section_added:
-            result_lines.append(f"### {section_type}")
-            result_lines.append(content)
-            result_lines.append("")
-
-        return result_lines
+        if end == -1:
+            return f"{file_content}\n### {section_type}\n{content}\n"
+        return f"{file_content[:end + 1]}### {section_type}\n{content}\n\n{file_content[end + 1:]}"
 
     def search_content(self, query: str) -> MarkdownResult:
         """Search for content in the markdown file"""
@@ -253,18 +283,57 @@ class MarkdownHandler:
         if not result.success:
             return result
 
-        lines = result.content.split('\n')
-        matching_lines = []
-        
-        for line in lines:
-            if query.lower() in line.lower():
-                matching_lines.append(line)
+        content = result.content
+        content_lower = content.lower()
+
+        if '\n' in query:
+            # Matching is per line, so a query spanning lines can never hit
+            matching_lines = []
+        elif len(content_lower) == len(content):
+            matching_lines = self._find_matching_lines(content, content_lower, query.lower())
+        else:
+            matching_lines = self._find_matching_lines_regex(content, query)
 
         if matching_lines:
             return MarkdownResult(success=True, content='\n'.join(matching_lines))
         else:
             return MarkdownResult(success=False, error=f"No results found for '{query}'")
 
+    def _find_matching_lines(self, content: str, content_lower: str, query_lower: str) -> list:
+        """Collect lines containing query_lower using str.find over the pre-lowercased buffer"""
+        matching_lines = []
+        pos = 0
+
+        while True:
+            hit = content_lower.find(query_lower, pos)
+            if hit == -1:
+                break
+            line_start = content.rfind('\n', 0, hit) + 1
+            line_end = content.find('\n', hit)
+            if line_end == -1:
+                line_end = len(content)
+            matching_lines.append(content[line_start:line_end])
+            pos = line_end + 1
+
+        return matching_lines
+
+    def _find_matching_lines_regex(self, content: str, query: str) -> list:
+        """Collect lines matching query case-insensitively, for text whose lowercase form changes length"""
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        matching_lines = []
+        line_end = -1
+
+        for match in pattern.finditer(content):
+            if match.start() <= line_end:
+                continue
+            line_start = content.rfind('\n', 0, match.start()) + 1
+            line_end = content.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(content)
+            matching_lines.append(content[line_start:line_end])
+
+        return matching_lines
+
     def delete_task(self, partial_text: str) -> MarkdownResult:
         """Find and delete a task based on partial text match"""
         if not partial_text.strip():
@@ -274,19 +343,19 @@ class MarkdownHandler:
         if not result.success:
             return result
 
-        lines = result.content.split('\n')
-        task_found = False
-
-        for i, line in enumerate(lines):
-            if TASK_INCOMPLETE in line and partial_text.lower() in line.lower():
-                lines.pop(i)
-                task_found = True
-                break
+        content = result.content
+        match = self._find_todo_line(content, partial_text)
 
-        if not task_found:
+        if match is None:
             return MarkdownResult(success=False, error=f"No task found containing '{partial_text}'")
 
-        return self._write_file_safely('\n'.join(lines))
+        start, end = match.span()
+        if end < len(content):
+            content = content[:start] + content[end + 1:]
+        else:
+            content = content[:max(start - 1, 0)]
+
+        return self._write_file_safely(content)
 
     def migrate_to_new_format(self) -> MarkdownResult:
         """Migrate old format to new user-subsection format"""
@@ -301,32 +370,17 @@ class MarkdownHandler:
         if "## Project Context" not in content:
             content = content.replace("Dev Notes", "Dev Notes\n\n## Project Context\n\n*Add project-level context, goals, and background information here*")
             
-        lines = content.split('\n')
-        new_lines = []
-
-        for line in lines:
-            if line.startswith("## ") and "(@" in line:
-                parts = line.split(" (@")
-                date_part = parts[0].replace("## ", "")
-                username = parts[1].replace(")", "")
-
-                new_lines.append(f"## {date_part}")
-                new_lines.append("")
-                new_lines.append(f"### {username} (@{username})")
-
-            elif line.startswith("### ") and not line.startswith("#### "):
-                section_name = line.replace("### ", "")
-                new_lines.append(f"#### {section_name}")
-            else:
-                new_lines.append(line)
+        content = _H3_RE.sub(r"#### \1", content)
+        content = _LEGACY_DATE_HEADER_RE.sub(r"## \1\n\n### \2 (@\2)", content)
 
-        return self._write_file_safely('\n'.join(new_lines))
+        return self._write_file_safely(content)
 
     def get_current_branch(self) -> str:
         """Get current git branch name with caching"""
         if self._cached_branch is not None:
             return self._cached_branch
         
+        import subprocess
         try:
             result = subprocess.run(['git', 'branch', '--show-current'],
                                         capture_output=True, text=True, cwd=os.path.dirname(self.file_path))
@@ -341,13 +395,18 @@ class MarkdownHandler:
         self._cached_branch = ""
         return ""
 
+    def invalidate_branch_cache(self) -> None:
+        """Forget the cached git branch so the next lookup runs git again"""
+        self._cached_branch = None
+
     def _find_task_in_content(self, lines: list, partial_text: str) -> tuple:
         """Find task and its date in content lines. Returns (task_found, task_date, task_index)"""
+        query = partial_text.lower()
         current_date = None
         for i, line in enumerate(lines):
-            if line.startswith("## ") and re.match(DATE_SECTION_PATTERN, line):
+            if _is_date_header(line):
                 current_date = line.replace("## ", "")
-            elif TASK_INCOMPLETE in line and partial_text.lower() in line.lower():
+            elif line.lstrip().startswith(TASK_INCOMPLETE) and query in line.lower():
                 return line.strip(), current_date, i
         return None, None, -1
 
@@ -370,14 +429,17 @@ class MarkdownHandler:
         if not result.success:
             return result
         
-        lines = result.content.split('\n')
+        if partial_text.lower() not in result.content.lower():
+            return MarkdownResult(success=False, error=f"No task found containing '{partial_text}'")
+
+        lines = self._split_lines(result.content)
         task_found, task_date, task_index = self._find_task_in_content(lines, partial_text)
         
         if not task_found:
             return MarkdownResult(success=False, error=f"No task found containing '{partial_text}'")
         
         updated_lines = self._remove_task_from_lines(lines, task_index)
-        write_result = self._write_file_safely('\n'.join(updated_lines))
+        write_result = self._write_lines_safely(updated_lines)
         if not write_result.success:
             return write_result
         
@@ -408,11 +470,14 @@ if [ -f "dev-notes.md" ]; then
 fi
 """
             
-            with open(hook_path, 'w') as f:
+            fd = os.open(hook_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            with os.fdopen(fd, 'w') as f:
+                if hasattr(os, "fchmod"):
+                    mode = os.fstat(fd).st_mode
+                    if not mode & stat.S_IEXEC:  # Pre-existing hook: os.open only applies mode on creation
+                        os.fchmod(fd, mode | stat.S_IEXEC)
                 f.write(hook_content)
             
-            os.chmod(hook_path, os.stat(hook_path).st_mode | stat.S_IEXEC)
-            
             return MarkdownResult(success=True)
             
         except Exception as e:
@@ -424,7 +489,7 @@ fi
         if not read_result.success:
             return read_result
 
-        lines = read_result.content.split('\n')
+        lines = self._split_lines(read_result.content)
         context_lines = []
         in_context = False
         
@@ -451,7 +516,7 @@ fi
         if not read_result.success:
             return read_result
 
-        lines = read_result.content.split('\n')
+        lines = self._split_lines(read_result.content)
         new_lines = []
         context_found = False
         skip_placeholder = False
@@ -477,7 +542,7 @@ fi
         if not context_found:
             return MarkdownResult(success=False, error="Project Context section not found")
 
-        return self._write_file_safely('\n'.join(new_lines))
+        return self._write_lines_safely(new_lines)
 
     def add_backlog_task(self, task: str) -> MarkdownResult:
         """Add a task to the backlog section"""
@@ -488,7 +553,7 @@ fi
         if not result.success:
             return result
 
-        lines = result.content.split('\n')
+        lines = self._split_lines(result.content)
         backlog_task = f"- [ ] {task}"
         backlog_exists = any(line.strip() == "## Backlog" for line in lines)
 
@@ -522,24 +587,24 @@ fi
                                 ""
                             ] + lines[insert_index:]
 
-        return self._write_file_safely('\n'.join(new_lines))
+        return self._write_lines_safely(new_lines)
 
     def _add_to_existing_backlog(self, lines: list, task: str) -> MarkdownResult:
-        """Add task to existing backlog section"""
-        for i, line in enumerate(lines):
-            if line.strip() == "## Backlog":
-
-                insert_index = len(lines)
-                for j in range(i + 1, len(lines)):
-                    if lines[j].startswith("## "):
+        """Add task to the end of the existing backlog section"""
+        backlog_index = next(i for i, line in enumerate(lines) if line.strip() == "## Backlog")
 
-                        insert_index = j
-                        break
+        section_end = len(lines)
+        for j in range(backlog_index + 1, len(lines)):
+            if lines[j].startswith("## "):
+                section_end = j
+                break
 
-                    lines.insert(insert_index, task)
-                    break
+        insert_index = section_end
+        while insert_index > backlog_index + 1 and not lines[insert_index - 1].strip():
+            insert_index -= 1
 
-                return self._write_file_safely('\n'.join(lines))
+        lines[insert_index:insert_index] = [task]
+        return self._write_lines_safely(lines)
 
     def promote_backlog_task(self, partial_text: str) -> MarkdownResult:
         """Move a task from backlog to today's todo section"""
@@ -550,7 +615,7 @@ fi
         if not result.success:
             return result
         
-        lines = result.content.split('\n')
+        lines = self._split_lines(result.content)
         
         task_found, task_index = self._find_backlog_task(lines, partial_text)
         if not task_found:
@@ -561,7 +626,7 @@ fi
         task_text = task_found.replace("- [ ]", "").strip()
         promoted_task = f"- [ ] {task_text} (promoted from backlog)"
         
-        write_result = self._write_file_safely('\n'.join(lines))
+        write_result = self._write_lines_safely(lines)
         if not write_result.success:
             return write_result
         
@@ -575,6 +640,7 @@ fi
 
     def _find_backlog_task(self, lines: list, partial_text: str) -> tuple:
         """Find task in backlog section. Returns (task_found, task_index)"""
+        query = partial_text.lower()
         in_backlog = False
         
         for i, line in enumerate(lines):
@@ -583,7 +649,7 @@ fi
                 continue
             elif line.startswith("## ") and in_backlog:
                 break
-            elif in_backlog and "- [ ]" in line and partial_text.lower() in line.lower():
+            elif in_backlog and line.lstrip().startswith(TASK_INCOMPLETE) and query in line.lower():
                 return line.strip(), i
         
         return None, -1
@@ -0,0 +1,66 @@
+import io
+import pytest
+from datetime import datetime
+from typer.testing import CliRunner
+from order.markdown_handler import MarkdownHandler, MarkdownResult
+
+class InMemoryMarkdownHandler(MarkdownHandler):
+    """MarkdownHandler whose storage seam reads and writes a shared StringIO instead of disk"""
+    buffer: io.StringIO = None
+
+    def _load(self) -> str:
+        return self.buffer.getvalue()
+
+    def _store(self, content: str) -> None:
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.buffer.write(content)
+
+    def create_file(self) -> MarkdownResult:
+        if self.buffer.getvalue():  # get_handler only sees disk, so keep notes a test already seeded
+            return MarkdownResult(success=True)
+        return super().create_file()
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+@pytest.fixture
+def in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def fake_fs(fs, monkeypatch):
+    monkeypatch.chdir("/")
+    return fs
+
+@pytest.fixture(scope="session")
+def session_today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+@pytest.fixture
+def today(session_today, monkeypatch):
+    """Pin the CLI's and handler's clock to the date the assertions expect, so a run crossing midnight can't disagree"""
+    frozen = datetime.strptime(session_today, "%Y-%m-%d")
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen
+
+    monkeypatch.setattr("order.cli.datetime", FrozenDatetime)
+    monkeypatch.setattr("order.markdown_handler.datetime", FrozenDatetime)
+    return session_today
+
+@pytest.fixture
+def in_memory_notes(in_tmp, monkeypatch):
+    buffer = io.StringIO()
+    monkeypatch.setattr(InMemoryMarkdownHandler, "buffer", buffer)
+    monkeypatch.setattr("order.cli.MarkdownHandler", InMemoryMarkdownHandler)
+    return buffer
@@ -306,6 +306,10 @@ def test_migrate_old_format_to_new_format():
 ## 2025-10-23 (@bob)
 ### Todo
 - [ ] Add tests
+
+## 2025-10-22 (@carol) \t
+### Todo
+- [ ] Review trailing whitespace
 """
         
         with open(file_path, 'w') as f:
@@ -324,6 +328,8 @@ def test_migrate_old_format_to_new_format():
         assert "#### Todo" in content_result.content
         assert "#### Notes" in content_result.content
         assert "### bob (@bob)" in content_result.content
+        assert "## 2025-10-22\n\n### carol (@carol)\n#### Todo" in content_result.content
+        assert "(@carol) " not in content_result.content
         assert "Fix authentication bug" in content_result.content
 
 def test_branch_aware_user_subsections():
@@ -436,3 +442,178 @@ def test_add_to_existing_date_section_is_testable():
         # Content should be in the 2025-10-25 section, not after 2025-10-24
         section_content = '\n'.join(lines[date_index:next_date_index])
         assert "New note content" in section_content
+
+def test_read_file_picks_up_external_changes(tmp_path):
+    """Test that the shared read cache is refreshed when the file changes on disk"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n")
+
+    assert "# Dev Notes" in MarkdownHandler(str(test_file)).read_file().content
+
+    test_file.write_text("# Dev Notes\n\n## 2025-10-25\n- [ ] Edited elsewhere\n")
+
+    result = MarkdownHandler(str(test_file)).read_file()
+    assert result.success
+    assert "Edited elsewhere" in result.content
+
+def test_read_cache_keys_relative_paths_by_directory(tmp_path, monkeypatch):
+    """Test that the same relative path in two directories never shares cached content"""
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    (first / "dev-notes.md").write_text("- [ ] Task in a\n")
+    (second / "dev-notes.md").write_text("- [ ] Task in b\n")
+    stamp = os.stat(first / "dev-notes.md").st_mtime_ns
+    os.utime(second / "dev-notes.md", ns=(stamp, stamp))
+
+    monkeypatch.chdir(first)
+    assert MarkdownHandler("dev-notes.md").read_file().content == "- [ ] Task in a\n"
+
+    monkeypatch.chdir(second)
+    assert MarkdownHandler("dev-notes.md").read_file().content == "- [ ] Task in b\n"
+
+def test_read_cache_detects_same_size_replace_within_one_mtime(tmp_path):
+    """Test that a same-size edit with an unchanged mtime is still seen once the file is replaced"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("- [ ] Task\n")
+    stamp = os.stat(test_file).st_mtime_ns
+
+    assert MarkdownHandler(str(test_file)).read_file().content == "- [ ] Task\n"
+
+    replacement = tmp_path / "replacement.md"
+    replacement.write_text("- [x] Task\n")
+    os.utime(replacement, ns=(stamp, stamp))
+    os.replace(replacement, test_file)
+
+    assert MarkdownHandler(str(test_file)).read_file().content == "- [x] Task\n"
+
+def test_delete_task_on_last_line_without_trailing_newline(tmp_path):
+    """Test that deleting the final line leaves the preceding lines intact"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n### Todo\n- [ ] Keep me\n- [ ] Remove me")
+
+    handler = MarkdownHandler(str(test_file))
+    result = handler.delete_task("remove")
+
+    assert result.success
+    assert test_file.read_text() == "# Dev Notes\n### Todo\n- [ ] Keep me"
+
+def test_write_replaces_file_atomically_and_keeps_permissions(tmp_path):
+    """Test that writes go through a temp file and preserve the original mode"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n### Todo\n- [ ] Task\n")
+    test_file.chmod(0o600)
+
+    handler = MarkdownHandler(str(test_file))
+    result = handler.mark_task_complete("Task")
+
+    assert result.success
+    assert "- [x] Task" in test_file.read_text()
+    assert test_file.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["test.md"]
+
+def test_write_through_symlink_updates_link_target(tmp_path):
+    """Test that writing a symlinked notes file updates the target and keeps the link"""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    target = shared / "notes.md"
+    target.write_text("# Dev Notes\n### Todo\n- [ ] Task\n")
+    project = tmp_path / "proj"
+    project.mkdir()
+    link = project / "dev-notes.md"
+    link.symlink_to(os.path.join("..", "shared", "notes.md"))
+
+    result = MarkdownHandler(str(link)).mark_task_complete("Task")
+
+    assert result.success
+    assert link.is_symlink()
+    assert "- [x] Task" in target.read_text()
+    assert [p.name for p in shared.iterdir()] == ["notes.md"]
+    assert [p.name for p in project.iterdir()] == ["dev-notes.md"]
+
+def test_search_content_returns_each_matching_line_once(tmp_path):
+    """Test that search is case-insensitive and reports a line once even with several hits"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n- Email the EMAIL team\n- Unrelated\n- last email")
+
+    result = MarkdownHandler(str(test_file)).search_content("email")
+
+    assert result.success
+    assert result.content == "- Email the EMAIL team\n- last email"
+
+def test_search_content_handles_text_whose_lowercase_changes_length(tmp_path):
+    """Test that search still slices whole lines when lowercasing would shift offsets"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n- İstanbul trip\n- Book hotel in istanbul\n", encoding="utf-8")
+
+    result = MarkdownHandler(str(test_file)).search_content("hotel")
+
+    assert result.success
+    assert result.content == "- Book hotel in istanbul"
+
+def test_search_content_does_not_match_across_lines(tmp_path):
+    """Test that a query containing a newline finds nothing, since matching is per line"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n- [ ] alpha\n- [ ] beta\n")
+
+    result = MarkdownHandler(str(test_file)).search_content("alpha\n- [ ] b")
+
+    assert not result.success
+    assert "No results found" in result.error
+
+def test_impossible_calendar_dates_are_rejected():
+    """Test that well-formed but non-existent dates are rejected"""
+    handler = MarkdownHandler("unused.md")
+
+    for impossible_date in ["2025-02-30", "2025-04-31", "2025-00-10", "2025-10-00"]:
+        result = handler._validate_date_format(impossible_date)
+
+        assert not result.success
+        assert "Invalid date format" in result.error
+
+    assert handler._validate_date_format("2024-02-29").success
+
+def test_current_branch_is_cached_until_invalidated(tmp_path):
+    """Test that git is spawned once per handler until the branch cache is invalidated"""
+    handler = MarkdownHandler(str(tmp_path / "dev-notes.md"))
+
+    with patch('subprocess.run') as mock_run:
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "feature-auth\n"
+
+        assert handler.get_current_branch() == "feature-auth"
+        assert handler.get_current_branch() == "feature-auth"
+        assert mock_run.call_count == 1
+
+        handler.invalidate_branch_cache()
+        handler.get_current_branch()
+        assert mock_run.call_count == 2
+
+def test_add_backlog_task_stays_inside_backlog_section(tmp_path):
+    """Test that new backlog tasks land at the end of the backlog, not the end of the file"""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Dev Notes\n\n## Backlog\n\n- [ ] First idea\n\n## 2025-10-24\n### Todo\n- [ ] Day task\n")
+
+    result = MarkdownHandler(str(test_file)).add_backlog_task("Second idea")
+
+    assert result.success
+    assert test_file.read_text() == (
+        "# Dev Notes\n\n## Backlog\n\n- [ ] First idea\n- [ ] Second idea\n\n"
+        "## 2025-10-24\n### Todo\n- [ ] Day task\n"
+    )
+
+def test_install_git_hooks_makes_existing_hook_executable(tmp_path, monkeypatch):
+    """Test that an existing non-executable pre-commit hook is overwritten and made executable"""
+    import stat
+
+    monkeypatch.chdir(tmp_path)
+    hook_path = tmp_path / ".git" / "hooks" / "pre-commit"
+    hook_path.parent.mkdir(parents=True)
+    hook_path.write_text("old hook\n")
+    hook_path.chmod(0o644)
+
+    result = MarkdownHandler(str(tmp_path / "dev-notes.md")).install_git_hooks()
+
+    assert result.success
+    assert "git add dev-notes.md" in hook_path.read_text()
+    assert hook_path.stat().st_mode & stat.S_IEXEC
@@ -1,90 +1,14 @@
-from typer.testing import CliRunner
-from order.cli import app
-import tempfile
+import pytest
+from order.cli import app, main, add_content, get_today, TODO_SECTION, find_dev_notes_file, _find_dev_notes_file
 import os
+import re
+from pathlib import Path
 import stat
-import subprocess
 from datetime import datetime
 from unittest.mock import patch
+from order.markdown_handler import MarkdownResult
 
-def test_add_task():
-    runner = CliRunner()
-    result = runner.invoke(app, ["add", "test"])
-    
-    assert result.exit_code == 0
-    assert "Task added" in result.stdout
-
-def test_add_task_creates_markdown():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            runner = CliRunner()
-            result = runner.invoke(app, ["add", "test markdown task"])
-
-            assert result.exit_code == 0
-            assert os.path.exists("dev-notes.md")
-
-            with open("dev-notes.md", "r") as f:
-                    content = f.read()
-                    today = datetime.now().strftime("%Y-%m-%d")
-
-                    assert f"## {today}" in content
-                    assert "### Todo" in content
-                    assert "- [ ] test markdown task" in content
-
-        finally:
-            os.chdir(original_dir)
-
-def test_note_command_creates_markdown():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            runner = CliRunner()
-            result = runner.invoke(app, ["note", "debugging email service "])
-
-            assert result.exit_code == 0
-            assert os.path.exists("dev-notes.md")
-
-            with open("dev-notes.md", "r") as f:
-                    content = f.read()
-                    today = datetime.now().strftime("%Y-%m-%d")
-
-                    assert f"## {today}" in content
-                    assert "### Notes" in content
-                    assert "debugging email service" in content
-
-        finally:
-            os.chdir(original_dir)
-
-def test_idea_command_creates_markdown():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            runner = CliRunner()
-            result = runner.invoke(app, ["idea", "Consider caching"])
-
-            assert result.exit_code == 0
-            assert os.path.exists("dev-notes.md")
-
-            with open("dev-notes.md", "r") as f:
-                content = f.read()
-                today = datetime.now().strftime("%Y-%m-%d")
-
-                assert f"## {today}" in content
-                assert "### Ideas" in content
-                assert "Consider caching" in content
-
-        finally:
-            os.chdir(original_dir)
-
-def test_list_command_displays_markdown_content():
-    test_content = """# Dev Notes
+LIST_CONTENT = """# Dev Notes
 
 ## 2025-10-23
 ### Todo
@@ -95,57 +19,15 @@ def test_list_command_displays_markdown_content():
 - Some context note
 """
 
-    with patch('order.cli.MarkdownHandler') as mock_handler:
-        from order.markdown_handler import MarkdownResult
-        mock_handler.return_value.read_file.return_value = MarkdownResult(success=True, content=test_content)
-        
-        runner = CliRunner()
-        result = runner.invoke(app, ["list"])
-
-        assert result.exit_code == 0
-        assert "Test task" in result.stdout
-        assert "Another task" in result.stdout
-        assert "Some context note" in result.stdout
-
-def test_done_command_marks_task_complete():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            with open("dev-notes.md", "w") as f:
-                f.write("""# Dev Notes
+DONE_FIXTURE_MD = """# Dev Notes
 
 ## 2025-10-23
 ### Todo
 - [ ] Test task to complete
 - [ ] Another task
-""")
-
-            runner = CliRunner()
-            result = runner.invoke(app, ["done", "Test task"])
-
-            assert result.exit_code == 0
-            assert "marked as complete" in result.stdout.lower()
-        
-            with open("dev-notes.md", "r") as f:
-                content = f.read()
-
-                assert "- [x] Test task to complete" in content
-                assert "- [ ] Another task" in content
-
-        finally:
-            os.chdir(original_dir)
- 
-def test_today_command_shows_only_current_day():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+"""
 
-        try:
-            with open("dev-notes.md", "w") as f:
-                today = datetime.now().strftime("%Y-%m-%d") 
-                f.write(f"""# Dev Notes
+TODAY_FIXTURE_MD = """# Dev Notes
 
 ## 2025-10-20
 ### Todo
@@ -160,28 +42,9 @@ def test_today_command_shows_only_current_day():
 ## 2025-10-28
 ### Todo
 - [ ] Future task
-""")
-
-            runner = CliRunner()
-            result = runner.invoke(app, ["today"])
-
-            assert result.exit_code == 0
-            assert "Today's task" in result.stdout
-            assert "Today's note" in result.stdout
-            assert "Old task" not in result.stdout
-            assert "Future task" not in result.stdout
-
-        finally:
-            os.chdir(original_dir)
-
-def test_search_command_finds_content():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+"""
 
-        try:
-            with open("dev-notes.md", "w") as f:
-                f.write("""# Dev Notes
+SEARCH_FIXTURE_MD = """# Dev Notes
 
 ## 2025-10-20
 ### Todo
@@ -195,43 +58,148 @@ def test_search_command_finds_content():
 
 ### Ideas
 - Consider redis caching
-""")
+"""
+
+NEW_FORMAT_MD = """# Dev Notes
+
+## Project Context
+
+*Add project-level context, goals, and background information here.*
+
+## {today}
 
-            runner = CliRunner()
-            result = runner.invoke(app, ["search", "email"])
+### alice-feature-auth (@alice)
+#### Todo
+- [ ] Fix login bug
+- [ ] Update authentication tests
+
+#### Notes
+- Left off debugging OAuth flow
+
+#### Ideas
+- Consider Redis for session storage
+
+### bob-main (@bob)
+#### Todo
+- [ ] Review Alice's PR
+- [ ] Deploy to staging
+"""
+
+CARRY_FIXTURE_MD = """# Dev Notes
+
+## 2025-10-24
+
+### testuser (@testuser)
+#### Todo
+- [ ] Fix login bug
+- [ ] Another task
+"""
+
+def assert_contains_only(stdout, should, should_not=()):
+    """Scan stdout once and check every needle in should appears and none in should_not do"""
+    pattern = re.compile("|".join(map(re.escape, [*should, *should_not])))
+    found = {match.group(0) for match in pattern.finditer(stdout)}
+
+    assert set(should) <= found, f"missing: {set(should) - found}"
+    assert not set(should_not) & found, f"unexpected: {set(should_not) & found}"
+
+def assert_file_contents(path, present=(), absent=()):
+    """Read path once and check every string in present appears and none in absent do"""
+    content = Path(path).read_text()
+    missing = [needle for needle in present if needle not in content]
+    unexpected = [needle for needle in absent if needle in content]
+
+    assert not missing and not unexpected, (missing, unexpected)
+
+@pytest.fixture(scope="session")
+def new_format_md(tmp_path_factory, session_today):
+    path = tmp_path_factory.mktemp("fixtures") / "new_format.md"
+    path.write_text(NEW_FORMAT_MD.format(today=session_today))
+    return path
+
+DONE_RE = re.compile(r"^- \[x\] Fix login bug$", re.M)
+OPEN_RE = re.compile(r"^- \[ \] Deploy to staging$", re.M)
+REVIEW_OPEN_RE = re.compile(r"^- \[ \] Review Alice's PR$", re.M)
+
+HELP_RE = re.compile(
+    rb"Order CLI - Developer Notes & Task Management.*Quick Start Examples:.*order add.*order note.*order done"
+    rb".*Git Integration:.*Team Collaboration:",
+    re.S,
+)
+
+@pytest.fixture
+def mock_markdown_handler():
+    with patch('order.cli.MarkdownHandler') as mock_handler:
+        mock_handler.return_value.read_file.return_value = MarkdownResult(success=True, content=LIST_CONTENT)
+        yield mock_handler
+
+def test_add_task(in_tmp):
+    result = add_content(TODO_SECTION, "- [ ] test")
+    
+    assert result.success
+    assert "- [ ] test" in (in_tmp / "dev-notes.md").read_text()
+
+@pytest.mark.parametrize("cmd,arg,section,body", [
+    ("add", "test markdown task", "### Todo", "- [ ] test markdown task"),
+    ("note", "debugging email service ", "### Notes", "debugging email service"),
+    ("idea", "Consider caching", "### Ideas", "Consider caching"),
+])
+def test_command_creates_markdown(runner, in_tmp, today, cmd, arg, section, body):
+    result = runner.invoke(app, [cmd, arg])
+
+    assert result.exit_code == 0
+    assert os.path.exists("dev-notes.md")
 
-            assert result.exit_code == 0
-            assert "email service debugging" in result.stdout
-            assert "authentication bug" not in result.stdout
-            assert "Redis caching" not in result.stdout
+    assert_file_contents("dev-notes.md", present=(f"## {today}", section, body))
 
-        finally:
-            os.chdir(original_dir)
+def test_list_command_displays_markdown_content(runner, mock_markdown_handler):
+    result = runner.invoke(app, ["list"])
+
+    assert result.exit_code == 0
+    assert b"Test task" in result.stdout_bytes
+    assert b"Another task" in result.stdout_bytes
+    assert b"Some context note" in result.stdout_bytes
+
+def test_done_command_marks_task_complete(runner, fake_fs):
+    fake_fs.create_file("dev-notes.md", contents=DONE_FIXTURE_MD)
+
+    result = runner.invoke(app, ["done", "Test task"])
+
+    assert result.exit_code == 0
+    assert b"marked as complete" in result.stdout_bytes.lower()
+
+    assert_file_contents("dev-notes.md", present=("- [x] Test task to complete", "- [ ] Another task"))
+ 
+def test_today_command_shows_only_current_day(runner, fake_fs, today):
+    fake_fs.create_file("dev-notes.md", contents=TODAY_FIXTURE_MD.format(today=today))
+
+    result = runner.invoke(app, ["today"])
+
+    assert result.exit_code == 0
+    assert_contains_only(result.stdout, ["Today's task", "Today's note"], ["Old task", "Future task"])
+
+def test_search_command_finds_content(runner, fake_fs):
+    fake_fs.create_file("dev-notes.md", contents=SEARCH_FIXTURE_MD)
+
+    result = runner.invoke(app, ["search", "email"])
+
+    assert result.exit_code == 0
+    assert_contains_only(result.stdout, ["email service debugging"], ["authentication bug", "Redis caching"])
 
 def test_poetry_script_entry_point_exists():
     """Test that the poetry script entry point is configured"""
-    import subprocess
-    import sys
-
-    try:
-        result = subprocess.run([sys.executable, "-c", "import order.cli; print('success')"],
-            capture_output=True, text=True, timeout=5)
+    import importlib
+    import tomllib
 
-        assert result.returncode == 0
-        assert "success" in result.stdout
+    pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
+    scripts = tomllib.loads(pyproject.read_text())["tool"]["poetry"]["scripts"]
+    module_name, _, attr = scripts["order"].partition(":")
 
-    except subprocess.TimeoutExpired:
-        pytest.fail("Import test timed out")
+    assert callable(getattr(importlib.import_module(module_name), attr))
 
-def test_delete_command_removes_task():
+def test_delete_command_removes_task(runner, fake_fs):
     """Test that delete command removes a task by partial text match"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            with open("dev-notes.md", "w") as f:
-                f.write("""# Dev Notes
+    Path("dev-notes.md").write_text("""# Dev Notes
 
 ## 2025-10-24
 ### Todo
@@ -239,352 +207,250 @@ def test_delete_command_removes_task():
 - [ ] Task to keep
 """)
 
-            runner = CliRunner()
-            result = runner.invoke(app, ["delete", "Task to delete"])
-
-            assert result.exit_code == 0
-            assert "deleted" in result.stdout.lower()
-            
-            with open("dev-notes.md", "r") as f:
-                content = f.read()
-                assert "Task to delete" not in content
-                assert "Task to keep" in content
+    result = runner.invoke(app, ["delete", "Task to delete"])
 
-        finally:
-            os.chdir(original_dir)
+    assert result.exit_code == 0
+    assert b"deleted" in result.stdout_bytes.lower()
+    
+    assert_file_contents("dev-notes.md", present=("Task to keep",), absent=("Task to delete",))
 
-def test_smart_file_discovery_finds_existing_file():
+def test_smart_file_discovery_finds_existing_file(runner, tmp_path, monkeypatch):
     """Test that CLI finds existing dev-notes.md in parent directories"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        root_notes = os.path.join(temp_dir, "dev-notes.md")
-        with open(root_notes, "w") as f:
-            f.write("# Dev Notes\n\n## 2025-10-24\n### Todo\n- [ ] Existing task\n")
-        
-        subdir = os.path.join(temp_dir, "src", "components")
-        os.makedirs(subdir)
-        
-        original_dir = os.getcwd()
-        os.chdir(subdir)
-        
-        try:
-            runner = CliRunner()
-            result = runner.invoke(app, ["add", "New task from subdir"])
-            
-            assert result.exit_code == 0
-            
-            assert os.path.exists(root_notes)
-            assert not os.path.exists(os.path.join(subdir, "dev-notes.md"))
-            
-            with open(root_notes, "r") as f:
-                content = f.read()
-                assert "Existing task" in content
-                assert "New task from subdir" in content
-                
-        finally:
-            os.chdir(original_dir)
-
-def test_configuration_system_respects_custom_file_path():
-    """Test that CLI respects custom dev-notes.md path from environment variable"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        custom_notes = os.path.join(temp_dir, "my-custom-notes.md")
-
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            os.environ["ORDER_NOTES_FILE"] = custom_notes
-
-            runner = CliRunner()
-            result = runner.invoke(app, ["add", "Custom file task"])
+    root_notes = tmp_path / "dev-notes.md"
+    root_notes.write_text("# Dev Notes\n\n## 2025-10-24\n### Todo\n- [ ] Existing task\n")
+    
+    subdir = os.path.join(tmp_path, "src", "components")
+    os.makedirs(subdir)
+    monkeypatch.chdir(subdir)
+    
+    result = runner.invoke(app, ["add", "New task from subdir"])
+    
+    assert result.exit_code == 0
+    
+    assert root_notes.exists()
+    assert not os.path.exists(os.path.join(subdir, "dev-notes.md"))
+    
+    assert_file_contents(root_notes, present=("Existing task", "New task from subdir"))
 
-            assert result.exit_code == 0
-            
-            assert os.path.exists(custom_notes)
-            assert not os.path.exists("dev-notes.md")
-            
-            with open(custom_notes, "r") as f:
-                content = f.read()
-                assert "Custom file task" in content
+@pytest.mark.serial
+def test_smart_file_discovery_respects_max_walk(tmp_path, monkeypatch):
+    """Test that the upward search for dev-notes.md stops after ORDER_NOTES_MAX_WALK levels"""
+    (tmp_path / "dev-notes.md").write_text("# Dev Notes\n")
 
-        finally:
-            os.chdir(original_dir)
-            if "ORDER_NOTES_FILE" in os.environ:
-                del os.environ["ORDER_NOTES_FILE"]
+    subdir = os.path.join(tmp_path, "src", "components")
+    os.makedirs(subdir)
+    monkeypatch.chdir(subdir)
 
-def test_all_commands_work_with_new_user_subsection_format():
-    """Test that all CLI commands work with new user-subsection format"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+    try:
+        with patch('order.cli.ORDER_NOTES_MAX_WALK', 2):
+            _find_dev_notes_file.cache_clear()
+            assert find_dev_notes_file() == "dev-notes.md"
+
+        with patch('order.cli.ORDER_NOTES_MAX_WALK', 3):
+            _find_dev_notes_file.cache_clear()
+            assert os.path.samefile(find_dev_notes_file(), os.path.join(tmp_path, "dev-notes.md"))
+
+    finally:
+        _find_dev_notes_file.cache_clear()
+
+@pytest.mark.serial
+def test_smart_file_discovery_is_memoized_per_directory(tmp_path, monkeypatch):
+    """Test that repeated lookups from the same directory do not walk the parent chain again"""
+    (tmp_path / "dev-notes.md").write_text("# Dev Notes\n")
+    subdir = tmp_path / "src" / "components"
+    subdir.mkdir(parents=True)
+    monkeypatch.chdir(subdir)
+
+    _find_dev_notes_file.cache_clear()
+    try:
+        with patch('os.stat', wraps=os.stat) as mock_stat:
+            first = find_dev_notes_file()
+            walk_calls = mock_stat.call_count
 
-        try:
-            new_format_content = """# Dev Notes
+            assert find_dev_notes_file() == first
+            assert walk_calls > 0
+            assert mock_stat.call_count == walk_calls
 
-## Project Context
+        monkeypatch.chdir(tmp_path)
+        assert os.path.samefile(find_dev_notes_file(), first)
 
-*Add project-level context, goals, and background information here.*
+    finally:
+        _find_dev_notes_file.cache_clear()
 
-## 2025-10-27
+def test_file_option_overrides_discovery(runner, tmp_path, monkeypatch):
+    """Test that --file points every command at the given notes file without changing directory"""
+    notes = tmp_path / "notes.md"
+    monkeypatch.setattr("order.cli._notes_file_override", None)  # restored after the test
 
-### alice-feature-auth (@alice)
-#### Todo
-- [ ] Fix login bug
-- [ ] Update authentication tests
+    result = runner.invoke(app, ["--file", str(notes), "add", "Explicit file task"])
 
-#### Notes
-- Left off debugging OAuth flow
+    assert result.exit_code == 0
+    assert "Explicit file task" in notes.read_text()
 
-#### Ideas
-- Consider Redis for session storage
+    result = runner.invoke(app, ["--file", str(notes), "done", "Explicit file"])
 
-### bob-main (@bob)
-#### Todo
-- [ ] Review Alice's PR
-- [ ] Deploy to staging
-"""
-            
-            with open("dev-notes.md", "w") as f:
-                f.write(new_format_content)
-
-            runner = CliRunner()
-            
-            result = runner.invoke(app, ["today"])
-            assert result.exit_code == 0
-            assert "alice-feature-auth" in result.stdout
-            assert "Fix login bug" in result.stdout
-            assert "bob-main" in result.stdout
-            
-            result = runner.invoke(app, ["search", "login"])
-            assert result.exit_code == 0
-            assert "Fix login bug" in result.stdout
-            
-            result = runner.invoke(app, ["done", "login bug"])
-            assert result.exit_code == 0
-            assert "marked as complete" in result.stdout.lower()
-            
-            with open("dev-notes.md", "r") as f:
-                content = f.read()
-                assert "- [x] Fix login bug" in content
-            
-            result = runner.invoke(app, ["delete", "Review Alice"])
-            assert result.exit_code == 0
-            assert "deleted" in result.stdout.lower()
-            
-            with open("dev-notes.md", "r") as f:
-                content = f.read()
-                assert "Review Alice's PR" not in content
-                assert "Deploy to staging" in content
-
-        finally:
-            os.chdir(original_dir)
-
-def test_add_command_with_branch_flag():
-    """Test that --branch flag overrides git branch detection"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-
-        try:
-            runner = CliRunner()
-            result = runner.invoke(app, ["add", "Test task", "--branch", "custom-feature"])
+    assert result.exit_code == 0
+    assert "- [x] Explicit file task" in notes.read_text()
 
-            assert result.exit_code == 0
-            assert os.path.exists("dev-notes.md")
+@pytest.mark.serial
+def test_configuration_system_respects_custom_file_path(runner, in_tmp, monkeypatch):
+    """Test that CLI respects custom dev-notes.md path from environment variable"""
+    custom_notes = in_tmp / "my-custom-notes.md"
+    monkeypatch.setenv("ORDER_NOTES_FILE", str(custom_notes))
 
-            with open("dev-notes.md", "r") as f:
-                    content = f.read()
+    result = runner.invoke(app, ["add", "Custom file task"])
 
-                    assert "custom-feature" in content
-                    assert "Test task" in content
+    assert result.exit_code == 0
+    assert custom_notes.exists()
+    assert not (in_tmp / "dev-notes.md").exists()
+    assert "Custom file task" in custom_notes.read_text()
 
-        finally:
-            os.chdir(original_dir)
+def test_all_commands_work_with_new_user_subsection_format(runner, fake_fs, new_format_md, today):
+    """Test that all CLI commands work with new user-subsection format"""
+    fake_fs.add_real_file(new_format_md, read_only=False, target_path="dev-notes.md")
 
-def test_get_today_function_returns_correct_format():
-    """Test that get_today returns date in YYYY-MM-DD format"""
-    from order.cli import get_today
-    from datetime import datetime
+    result = runner.invoke(app, ["today"])
+    assert result.exit_code == 0
+    assert_contains_only(result.stdout, ["alice-feature-auth", "Fix login bug", "bob-main"])
     
-    result = get_today()
-    expected = datetime.now().strftime("%Y-%m-%d")
+    result = runner.invoke(app, ["search", "login"])
+    assert result.exit_code == 0
+    assert b"Fix login bug" in result.stdout_bytes
+    
+    result = runner.invoke(app, ["done", "login bug"])
+    assert result.exit_code == 0
+    assert b"marked as complete" in result.stdout_bytes.lower()
+    
+    content = Path("dev-notes.md").read_text()
+    assert DONE_RE.search(content) and REVIEW_OPEN_RE.search(content)
+    
+    result = runner.invoke(app, ["delete", "Review Alice"])
+    assert result.exit_code == 0
+    assert b"deleted" in result.stdout_bytes.lower()
     
-    assert result == expected
-    assert len(result) == 10
-    assert result.count('-') == 2
+    content = Path("dev-notes.md").read_text()
+    assert DONE_RE.search(content) and OPEN_RE.search(content)
+    assert "Review Alice's PR" not in content
 
-def test_carry_command_moves_task_with_history():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+def test_add_command_with_branch_flag(runner, in_tmp):
+    """Test that --branch flag overrides git branch detection"""
+    result = runner.invoke(app, ["add", "Test task", "--branch", "custom-feature"])
 
-        try:
-            with open("dev-notes.md", "w") as f:
-                f.write("""# Dev Notes
+    assert result.exit_code == 0
+    assert b"Task added: - [ ] Test task" in result.stdout_bytes
+    assert_file_contents("dev-notes.md", present=("custom-feature",))
 
-## 2025-10-24
+def test_note_command_with_branch_flag(runner, in_memory_notes):
+    """Test that a note lands in the --branch subsection without touching disk"""
+    result = runner.invoke(app, ["note", "Branch note", "--branch", "custom-feature"])
 
-### testuser (@testuser)
-#### Todo
-- [ ] Fix login bug
-- [ ] Another task
-""")
+    assert result.exit_code == 0
+    assert b"Note added: Branch note" in result.stdout_bytes
+    assert not os.path.exists("dev-notes.md")
+    assert re.search(r"^### \S*custom-feature \(@.+\)\n#### Notes\nBranch note$", in_memory_notes.getvalue(), re.M)
 
-            runner = CliRunner()
-            result = runner.invoke(app, ["carry", "Fix login"])
+def test_get_today_function_returns_correct_format():
+    """Test that get_today returns date in YYYY-MM-DD format"""
+    result = get_today()
 
-            assert result.exit_code == 0
-            assert "Task carried forward" in result.stdout
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}", result)
+    assert datetime.strptime(result, "%Y-%m-%d")
 
-            with open("dev-notes.md", "r") as f:
-                    content = f.read()
-                    today = datetime.now().strftime("%Y-%m-%d")
+def test_carry_command_moves_task_with_history(runner, in_tmp, today):
+    (in_tmp / "dev-notes.md").write_text(CARRY_FIXTURE_MD)
 
-                    assert f"- [ ] Fix login bug (carried from 2025-10-24)" in content
-                    assert f"## {today}" in content
+    result = runner.invoke(app, ["carry", "Fix login"])
 
-        finally:
-            os.chdir(original_dir)
+    assert result.exit_code == 0
+    assert b"Task carried forward: - [ ] Fix login bug (carried from 2025-10-24)" in result.stdout_bytes
 
-def test_install_hooks_command_creates_git_hooks():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+    content = (in_tmp / "dev-notes.md").read_text()
+    today_section = re.search(rf"^## {today}$(.*?)(?=^## |\Z)", content, re.M | re.S)
+    old_section = re.search(r"^## 2025-10-24$(.*?)(?=^## |\Z)", content, re.M | re.S)
 
-        try:
-            subprocess.run(["git", "init"], capture_output=True)
+    assert today_section and "- [ ] Fix login bug (carried from 2025-10-24)" in today_section.group(1)
+    assert old_section and "Fix login bug" not in old_section.group(1)
+    assert "- [ ] Another task" in old_section.group(1)
 
-            runner = CliRunner()
-            result = runner.invoke(app, ["install-hooks"])
+def test_install_hooks_command_creates_git_hooks(runner, in_tmp):
+    (in_tmp / ".git" / "hooks").mkdir(parents=True)
+    (in_tmp / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
 
-            assert result.exit_code == 0
-            assert "Git hooks installed successfully" in result.stdout
+    result = runner.invoke(app, ["install-hooks"])
 
-            hook_path = ".git/hooks/pre-commit"
-            assert os.path.exists(hook_path)
-            assert os.stat(hook_path).st_mode & stat.S_IEXEC
+    assert result.exit_code == 0
+    assert b"Git hooks installed successfully" in result.stdout_bytes
 
-        finally:
-            os.chdir(original_dir)
+    hook_path = ".git/hooks/pre-commit"
+    assert os.path.exists(hook_path)
+    assert os.stat(hook_path).st_mode & stat.S_IEXEC
 
-def test_context_command_adds_project_context_fixed():
-    """Test context command adds content to project context section"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-        
-        try:
-            with open("dev-notes.md", 'w') as f:
-                f.write("""# Dev Notes
+def test_context_command_round_trips_project_context(runner, in_tmp):
+    """Test context command adds project context that context show then displays"""
+    Path("dev-notes.md").write_text("""# Dev Notes
 
 ## Project Context
 
 *Add project-level context, goals, and background information here.*
 
 """)
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ["context", "Working on user authentication system"])
-            
-            assert result.exit_code == 0
-            assert "Context added: Working on user authentication system" in result.stdout
-            
-            with open("dev-notes.md", 'r') as f:
-                content = f.read()
-                assert "Working on user authentication system" in content
-                assert "## Project Context" in content
-        finally:
-            os.chdir(original_dir)
-
-def test_context_show_command_displays_current_context_fixed():
-    """Test context show command displays current project context"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-        
-        try:
-            with open("dev-notes.md", 'w') as f:
-                f.write("""# Dev Notes
+    
+    result = runner.invoke(app, ["context", "Working on user authentication system"])
+    
+    assert result.exit_code == 0
+    assert b"Context added: Working on user authentication system" in result.stdout_bytes
 
-## Project Context
+    result = runner.invoke(app, ["context", "show"])
 
-Working on user authentication system
+    assert result.exit_code == 0
+    assert b"Working on user authentication system" in result.stdout_bytes
 
-""")
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ["context", "show"])
-            
-            assert result.exit_code == 0
-            assert "Working on user authentication system" in result.stdout
-        finally:
-            os.chdir(original_dir)
-
-def test_help_command_shows_comprehensive_usage():
+def test_help_command_shows_comprehensive_usage(runner):
     """Test that help command shows detailed usage examples"""
-    runner = CliRunner()
     result = runner.invoke(app, ["help"])
     
     assert result.exit_code == 0
-    assert "Order CLI - Developer Notes & Task Management" in result.stdout
-    assert "Quick Start Examples:" in result.stdout
-    assert "order add" in result.stdout
-    assert "order note" in result.stdout
-    assert "order done" in result.stdout
-    assert "Git Integration:" in result.stdout
-    assert "Team Collaboration:" in result.stdout
-
-def test_backlog_command_adds_task_to_backlog():
-    """Test that backlog command adds tasks to backlog section"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+    assert HELP_RE.search(result.stdout_bytes)
 
-        try:
-            runner = CliRunner()
-            result = runner.invoke(app, ["backlog", "Research new framework"])
-
-            assert result.exit_code == 0
-            assert "Backlog task added" in result.stdout
+def test_backlog_command_adds_task_to_backlog(runner, in_tmp):
+    """Test that backlog command adds tasks to backlog section"""
+    result = runner.invoke(app, ["backlog", "Research new framework"])
 
-            with open("dev-notes.md", "r") as f:
-                    content = f.read()
+    assert result.exit_code == 0
+    assert b"Backlog task added" in result.stdout_bytes
 
-                    assert "## Backlog" in content
-                    assert "- [ ] Research new framework" in content
+    content = Path("dev-notes.md").read_text()
 
-                    lines = content.split('\n')
+    assert "- [ ] Research new framework" in content
 
-                    project_context_idx = next(i for i, line in enumerate(lines) if line.strip() == "## Project Context")
-                    backlog_idx = next(i for i, line in enumerate(lines) if line.strip() == "## Backlog")
-                    
-                    assert backlog_idx > project_context_idx  # Backlog comes after Project Context
+    project_context = re.search(r"^## Project Context[ \t]*$", content, re.M)
+    backlog = re.search(r"^## Backlog[ \t]*$", content, re.M)
 
-        finally:
-            os.chdir(original_dir)
+    assert project_context and backlog
+    assert backlog.start() > project_context.start()  # Backlog comes after Project Context
 
-def test_promote_command_moves_task_from_backlog_to_today():
+def test_promote_command_moves_task_from_backlog_to_today(runner, in_tmp):
     """Test that promote command moves tasks from backlog to today's section"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+    runner.invoke(app, ["backlog", "Research new framework"])
 
-        try:
-            runner = CliRunner()
-            runner.invoke(app, ["backlog", "Research new framework"])
+    result = runner.invoke(app, ["promote", "Research"])
+
+    assert result.exit_code == 0
+    assert b"Task promoted: - [ ] Research new framework (promoted from backlog)" in result.stdout_bytes
 
-            result = runner.invoke(app, ["promote", "Research"])
+    content = Path("dev-notes.md").read_text()
 
-            assert result.exit_code == 0
-            assert "Task promoted" in result.stdout
+    assert "- [ ] Research new framework (promoted from backlog)" in content
 
-            with open("dev-notes.md", "r") as f:
-                    content = f.read()
-            
-                    assert "- [ ] Research new framework (promoted from backlog)" in content
+    backlog_section = content.split("## Backlog")[1].split("##")[0]
 
-                    backlog_section = content.split("## Backlog")[1].split("##")[0]
+    assert "Research new framework" not in backlog_section
 
-                    assert "Research new framework" not in backlog_section
+@pytest.mark.serial
+def test_main_dispatches_fast_commands_without_typer(runner, capsys):
+    """Test that the console entry point runs help directly and still matches the typer output"""
+    with patch('sys.argv', ["order", "help"]), patch('order.cli.app') as mock_app:
+        main()
 
-        finally:
-            os.chdir(original_dir)
+    mock_app.assert_not_called()
+    assert capsys.readouterr().out == runner.invoke(app, ["help"]).stdout